@@ -10,12 +10,14 @@ from ..role import DefaultRoles, SystemRole
 
 completion: Callable[..., Any] = lambda *args, **kwargs: Generator[Any, None, None]
 
-base_url = cfg.get("API_BASE_URL")
+api_base_url = cfg.get("API_BASE_URL")
+base_url = None if api_base_url == "default" else api_base_url
+timeout = int(cfg.get("REQUEST_TIMEOUT"))
 use_litellm = cfg.get("USE_LITELLM") == "true"
 additional_kwargs = {
-    "timeout": int(cfg.get("REQUEST_TIMEOUT")),
+    "timeout": timeout,
     "api_key": cfg.get("OPENAI_API_KEY"),
-    "base_url": None if base_url == "default" else base_url,
+    "base_url": base_url,
 }
 
 if use_litellm:
@@ -37,10 +39,8 @@ class Handler:
 
     def __init__(self, role: SystemRole, markdown: bool) -> None:
         self.role = role
-
-        api_base_url = cfg.get("API_BASE_URL")
-        self.base_url = None if api_base_url == "default" else api_base_url
-        self.timeout = int(cfg.get("REQUEST_TIMEOUT"))
+        self.base_url = base_url
+        self.timeout = timeout
 
         self.markdown = "APPLY MARKDOWN" in self.role.role and markdown
         self.code_theme, self.color = cfg.get("CODE_THEME"), cfg.get("DEFAULT_COLOR")